@@ -16,6 +16,8 @@ TNULL           = TypeVar("TNULL",          bound="NULL")
 TOID            = TypeVar("TOID",           bound="OBJECT_IDENTIFIER")
 
 class ASN1:
+    __slots__ = ()
+
     TAG: ClassVar[Tag]
 
     @overload
@@ -63,6 +65,8 @@ class ASN1:
         raise NotImplementedError()
 
 class Constructed(ASN1):
+    __slots__ = ()
+
     def __eq__(self, other: Any) -> bool:
         if not isinstance(other, Constructed):
             return NotImplemented
@@ -86,6 +90,8 @@ class Constructed(ASN1):
         return b"".join([obj.encode() for obj in self])
 
 class Primitive(ASN1):
+    __slots__ = ()
+
     def asOID(self, implied: bool = False) -> Iterable[int]:
         raise NotImplementedError()
 
@@ -98,6 +104,8 @@ class Primitive(ASN1):
         raise NotImplementedError()
 
 class INTEGER(Primitive):
+    __slots__ = ("_value",)
+
     BYTEORDER: ClassVar[Literal["big"]] = "big"
     TAG = Tag(2)
 
@@ -154,6 +162,8 @@ class INTEGER(Primitive):
             raise OBJECT_IDENTIFIER.IndexDecodeError(*err.args) from err
 
 class OCTET_STRING(Primitive):
+    __slots__ = ("_data",)
+
     TAG = Tag(4)
 
     def __init__(self, data: bytes = b"") -> None:
@@ -210,6 +220,8 @@ class OCTET_STRING(Primitive):
         return self.data
 
 class NULL(Primitive):
+    __slots__ = ()
+
     TAG = Tag(5)
 
     def __eq__(self, other: Any) -> bool:
@@ -465,4 +477,6 @@ class OBJECT_IDENTIFIER(Primitive):
         return bytes(encoding)
 
 class SEQUENCE(Constructed):
+    __slots__ = ()
+
     TAG = Tag(16, True)
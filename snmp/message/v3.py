@@ -1,7 +1,10 @@
 __all__ = ["HeaderData", "MessageFlags", "ScopedPDU", "SNMPv3Message"]
 
 import threading
-import weakref
+
+from functools import lru_cache
+from random import getrandbits
+from types import MappingProxyType
 
 from snmp.asn1 import *
 from snmp.ber import *
@@ -14,7 +17,7 @@ from snmp.smi import *
 from snmp.typing import *
 from snmp.utils import *
 
-pduTypes = {
+pduTypes: Mapping[Tag, Type[AnyPDU]] = MappingProxyType({
     cls.TAG: cls for cls in cast(Tuple[Type[AnyPDU], ...], (
         GetRequestPDU,
         GetNextRequestPDU,
@@ -25,7 +28,37 @@ pduTypes = {
         SNMPv2TrapPDU,
         ReportPDU,
     ))
-}
+})
+
+_EMPTY_TYPES: Mapping[Tag, Type[AnyPDU]] = MappingProxyType({})
+
+# Classification bits for PDU types, so the inbound hot path can test
+# membership with an int mask instead of repeated isinstance checks.
+_PDU_RESPONSE:  int = 1 << 0
+_PDU_INTERNAL:  int = 1 << 1
+_PDU_CONFIRMED: int = 1 << 2
+
+@lru_cache(maxsize=None)
+def _pduFlags(pduType: Type[Any]) -> int:
+    flags = 0
+
+    if issubclass(pduType, Response):
+        flags |= _PDU_RESPONSE
+
+    if issubclass(pduType, Internal):
+        flags |= _PDU_INTERNAL
+
+    if issubclass(pduType, Confirmed):
+        flags |= _PDU_CONFIRMED
+
+    return flags
+
+# BER PDU tags always fit in one byte, so the standard table above is
+# mirrored as a 256-entry list indexed directly by the tag byte.
+_PDU_BY_TAG: List[Optional[Type[AnyPDU]]] = [None] * 256
+for pduType in pduTypes.values():
+    _PDU_BY_TAG[pduType.TAG.encode()[0]] = pduType
+del pduType
 
 class InvalidMessage(IncomingMessageError):
     pass
@@ -41,8 +74,27 @@ class ResponseMismatch(IncomingMessageError):
 class UnknownSecurityModel(IncomingMessageError):
     pass
 
+@lru_cache(maxsize=16)
+def _indent(depth: int, tab: str) -> Tuple[str, str]:
+    return tab * depth, tab * (depth + 1)
+
+# There are only eight possible flag bytes, so the data for every encode()
+# call comes from this table rather than a fresh bytes object.
+_FLAG_BYTES = tuple(bytes((i,)) for i in range(8))
+
+# SecurityLevel for each combination of the auth and priv bits; None marks
+# the invalid privacy-without-authentication combination.
+_SECURITY_LEVELS: Tuple[Optional[SecurityLevel], ...] = (
+    noAuthNoPriv,
+    authNoPriv,
+    None,
+    authPriv,
+)
+
 @final
 class MessageFlags(OctetString):
+    __slots__ = ("_securityLevel", "_byte", "_encoding")
+
     AUTH_FLAG: ClassVar[int]        = (1 << 0)
     PRIV_FLAG: ClassVar[int]        = (1 << 1)
     REPORTABLE_FLAG: ClassVar[int]  = (1 << 2)
@@ -51,6 +103,8 @@ class MessageFlags(OctetString):
         securityLevel: SecurityLevel = noAuthNoPriv,
         reportable: bool = False,
     ) -> None:
+        self._byte = 0
+        self._encoding: Optional[bytes] = None
         self.securityLevel = securityLevel
         self.reportableFlag = reportable
 
@@ -61,8 +115,7 @@ class MessageFlags(OctetString):
         return self.toString()
 
     def toString(self, depth: int = 0, tab: str = "    ") -> str:
-        indent = tab * depth
-        subindent = indent + tab
+        indent, subindent = _indent(depth, tab)
 
         return "\n".join((
             f"{indent}{typename(self)}:",
@@ -77,31 +130,61 @@ class MessageFlags(OctetString):
         except IndexError as err:
             raise ParseError(f"{typename(cls)} must contain at least one byte")
 
-        try:
-            securityLevel = SecurityLevel(
-                byte & cls.AUTH_FLAG,
-                byte & cls.PRIV_FLAG,
-            )
-        except ValueError as err:
-            raise InvalidMessage(f"Invalid msgFlags: {err}") from err
+        return cls._fromByte(byte)
 
-        reportable = (byte & cls.REPORTABLE_FLAG != 0)
-        return cls(securityLevel, reportable)
+    @classmethod
+    def _fromByte(cls, byte: int) -> "MessageFlags":
+        securityLevel = _SECURITY_LEVELS[byte & 0x03]
+        if securityLevel is None:
+            errmsg = "Privacy without authentication is not valid"
+            raise InvalidMessage(f"Invalid msgFlags: {errmsg}")
+
+        flags = cls.__new__(cls)
+        flags._securityLevel = securityLevel
+        flags._byte = byte & 0x07
+        flags._encoding = None
+        return flags
+
+    def encode(self) -> bytes:
+        if self._encoding is None:
+            self._encoding = super().encode()
+
+        return self._encoding
 
     @property
     def data(self) -> bytes:
-        byte = 0
+        return _FLAG_BYTES[self._byte]
+
+    @property
+    def securityLevel(self) -> SecurityLevel:
+        return self._securityLevel
+
+    @securityLevel.setter
+    def securityLevel(self, securityLevel: SecurityLevel) -> None:
+        byte = self._byte & self.REPORTABLE_FLAG
 
-        if self.authFlag:
+        if securityLevel.auth:
             byte |= self.AUTH_FLAG
 
-        if self.privFlag:
+        if securityLevel.priv:
             byte |= self.PRIV_FLAG
 
-        if self.reportableFlag:
-            byte |= self.REPORTABLE_FLAG
+        self._securityLevel = securityLevel
+        self._byte = byte
+        self._encoding = None
 
-        return bytes((byte,))
+    @property
+    def reportableFlag(self) -> bool:
+        return bool(self._byte & self.REPORTABLE_FLAG)
+
+    @reportableFlag.setter
+    def reportableFlag(self, value: Any) -> None:
+        if value:
+            self._byte |= self.REPORTABLE_FLAG
+        else:
+            self._byte &= ~self.REPORTABLE_FLAG
+
+        self._encoding = None
 
     @property
     def authFlag(self) -> bool:
@@ -109,12 +192,10 @@ class MessageFlags(OctetString):
 
     @authFlag.setter
     def authFlag(self, value: Any) -> None:
-        auth = bool(value)
-        if auth != self.securityLevel.auth:
-            self.securityLevel = SecurityLevel(
-                auth,
-                self.securityLevel.priv,
-            )
+        if value:
+            self._setLevelByte(self._byte | self.AUTH_FLAG)
+        else:
+            self._setLevelByte(self._byte & ~self.AUTH_FLAG)
 
     @property
     def privFlag(self) -> bool:
@@ -122,31 +203,115 @@ class MessageFlags(OctetString):
 
     @privFlag.setter
     def privFlag(self, value: Any) -> None:
-        priv = bool(value)
-        if priv != self.securityLevel.priv:
-            self.securityLevel = SecurityLevel(
-                self.securityLevel.auth,
-                priv,
-            )
+        if value:
+            self._setLevelByte(self._byte | self.PRIV_FLAG)
+        else:
+            self._setLevelByte(self._byte & ~self.PRIV_FLAG)
+
+    def _setLevelByte(self, byte: int) -> None:
+        securityLevel = _SECURITY_LEVELS[byte & 0x03]
+        if securityLevel is None:
+            raise ValueError("Privacy without authentication is not valid")
+
+        self._securityLevel = securityLevel
+        self._byte = byte
+        self._encoding = None
+
+# Every outgoing header uses the same default maxSize, so the Integer
+# wrapper for it is shared rather than rebuilt per message.
+_INTEGER_DEFAULT_MAX_SIZE = Integer(1472)
+
+def _decodeSmallInt(data: Asn1Data, offset: int) -> Optional[Tuple[int, int]]:
+    # Decode a short-form INTEGER TLV with a payload of up to four bytes,
+    # returning the value and the offset just past the TLV, or None if the
+    # encoding is anything less common than that.
+    try:
+        if data[offset] != 0x02:
+            return None
+
+        length = data[offset+1]
+    except IndexError:
+        return None
+
+    if length == 0 or length > 4:
+        return None
+
+    end = offset + 2 + length
+    if end > len(data):
+        return None
+
+    return int.from_bytes(data[offset+2:end], "big", signed=True), end
 
 @final
 class HeaderData(Sequence):
+    __slots__ = ("_objects", "_id", "_maxSize", "_flags", "_securityModel")
+
     def __init__(self,
         msgID: int,
         maxSize: int,
         flags: MessageFlags,
         securityModel: SecurityModel,
     ) -> None:
-        self.id = msgID
-        self.maxSize = maxSize
-        self.flags = flags
-        self.securityModel = securityModel
+        self._objects: Optional[List[ASN1]] = None
+        self._id = msgID
+        self._maxSize = maxSize
+        self._flags = flags
+        self._securityModel = securityModel
+
+    def _invalidate(self) -> None:
+        self._objects = None
+
+    @property
+    def id(self) -> int:
+        return self._id
+
+    @id.setter
+    def id(self, msgID: int) -> None:
+        self._id = msgID
+        self._invalidate()
+
+    @property
+    def maxSize(self) -> int:
+        return self._maxSize
+
+    @maxSize.setter
+    def maxSize(self, maxSize: int) -> None:
+        self._maxSize = maxSize
+        self._invalidate()
+
+    @property
+    def flags(self) -> MessageFlags:
+        return self._flags
+
+    @flags.setter
+    def flags(self, flags: MessageFlags) -> None:
+        self._flags = flags
+        self._invalidate()
+
+    @property
+    def securityModel(self) -> SecurityModel:
+        return self._securityModel
+
+    @securityModel.setter
+    def securityModel(self, securityModel: SecurityModel) -> None:
+        self._securityModel = securityModel
+        self._invalidate()
 
     def __iter__(self) -> Iterator[ASN1]:
-        yield Integer(self.id)
-        yield Integer(self.maxSize)
-        yield self.flags
-        yield Integer(self.securityModel)
+        if self._objects is None:
+            if self._maxSize == _INTEGER_DEFAULT_MAX_SIZE.value:
+                maxSize = _INTEGER_DEFAULT_MAX_SIZE
+            else:
+                maxSize = Integer(self._maxSize)
+
+            self._objects = [
+                Integer(self._id),
+                maxSize,
+                self._flags,
+                Integer(self._securityModel),
+            ]
+
+        return iter(self._objects)
 
     def __len__(self) -> int:
         return 4
@@ -165,8 +330,7 @@ class HeaderData(Sequence):
         return self.toString()
 
     def toString(self, depth: int = 0, tab: str = "    ") -> str:
-        indent = tab * depth
-        subindent = indent + tab
+        indent, subindent = _indent(depth, tab)
         securityModel = SecurityModel(self.securityModel)
 
         return "\n".join((
@@ -179,6 +343,10 @@ class HeaderData(Sequence):
 
     @classmethod
     def deserialize(cls, data: Asn1Data) -> "HeaderData":
+        header = cls._deserializeFast(data)
+        if header is not None:
+            return header
+
         msgID, data = cast(
             Tuple[Integer, subbytes],
             Integer.decode(data, leftovers=True),
@@ -215,17 +383,109 @@ class HeaderData(Sequence):
             securityModel,
         )
 
+    @classmethod
+    def _deserializeFast(cls, data: Asn1Data) -> Optional["HeaderData"]:
+        # Decode the typical all-short-form header without allocating any
+        # Integer wrappers. Anything unusual, including every value the
+        # checks in deserialize reject, returns None so that the general
+        # path can produce its error.
+        decoded = _decodeSmallInt(data, 0)
+        if decoded is None:
+            return None
+
+        msgID, offset = decoded
+        if msgID < 0:
+            return None
+
+        decoded = _decodeSmallInt(data, offset)
+        if decoded is None:
+            return None
+
+        msgMaxSize, offset = decoded
+        if msgMaxSize < 484:
+            return None
+
+        try:
+            if data[offset] != 0x04:
+                return None
+
+            length = data[offset+1]
+            if length == 0 or length >= 0x80:
+                return None
+
+            byte = data[offset+2]
+        except IndexError:
+            return None
+
+        decoded = _decodeSmallInt(data, offset + 2 + length)
+        if decoded is None:
+            return None
+
+        msgSecurityModel, offset = decoded
+        if msgSecurityModel != SecurityModel.USM or offset != len(data):
+            return None
+
+        return cls(
+            msgID,
+            msgMaxSize,
+            MessageFlags._fromByte(byte),
+            SecurityModel.USM,
+        )
+
 @final
 class ScopedPDU(Sequence):
+    __slots__ = (
+        "_encoding", "_contextEngineID", "_contextName", "_pdu", "_pduFlags",
+    )
+
     def __init__(self,
         pdu: AnyPDU,
         contextEngineID: bytes,
         contextName: bytes = b"",
     ) -> None:
-        self.contextEngineID = contextEngineID
-        self.contextName = contextName
+        self._encoding: Optional[bytes] = None
+        self._contextEngineID = contextEngineID
+        self._contextName = contextName
         self.pdu = pdu
 
+    @property
+    def contextEngineID(self) -> bytes:
+        return self._contextEngineID
+
+    @contextEngineID.setter
+    def contextEngineID(self, contextEngineID: bytes) -> None:
+        self._contextEngineID = contextEngineID
+        self._encoding = None
+
+    @property
+    def contextName(self) -> bytes:
+        return self._contextName
+
+    @contextName.setter
+    def contextName(self, contextName: bytes) -> None:
+        self._contextName = contextName
+        self._encoding = None
+
+    @property
+    def pdu(self) -> AnyPDU:
+        return self._pdu
+
+    @pdu.setter
+    def pdu(self, pdu: AnyPDU) -> None:
+        self._pdu = pdu
+        self._pduFlags = _pduFlags(type(pdu))
+        self._encoding = None
+
+    @property
+    def pduFlags(self) -> int:
+        return self._pduFlags
+
+    def encode(self) -> bytes:
+        if self._encoding is None:
+            self._encoding = super().encode()
+
+        return self._encoding
+
     def __iter__(self) -> Iterator[ASN1]:
         yield OctetString(self.contextEngineID)
         yield OctetString(self.contextName)
@@ -247,8 +507,7 @@ class ScopedPDU(Sequence):
         return self.toString()
 
     def toString(self, depth: int = 0, tab: str = "    ") -> str:
-        indent = tab * depth
-        subindent = indent + tab
+        indent, subindent = _indent(depth, tab)
         return "\n".join((
             f"{indent}{typename(self)}:",
             f"{subindent}Context Engine ID: {self.contextEngineID!r}",
@@ -259,11 +518,8 @@ class ScopedPDU(Sequence):
     @classmethod
     def deserialize(cls,
         data: Asn1Data,
-        types: Optional[Mapping[Tag, Type[AnyPDU]]] = None,
+        types: Mapping[Tag, Type[AnyPDU]] = _EMPTY_TYPES,
     ) -> "ScopedPDU":
-        if types is None:
-            types = dict()
-
         contextEngineID, data = cast(
             Tuple[OctetString, subbytes],
             OctetString.decode(data, leftovers=True),
@@ -274,12 +530,24 @@ class ScopedPDU(Sequence):
             OctetString.decode(data, leftovers=True),
         )
 
-        identifier, _ = Tag.decode(subbytes(data))
+        if types is pduTypes:
+            try:
+                tagByte = data[0]
+            except IndexError as err:
+                raise ParseError("Missing tag") from err
 
-        try:
-            pduType = types[identifier]
-        except KeyError as err:
-            raise ParseError(f"Invalid PDU type: {identifier}") from err
+            pduType = _PDU_BY_TAG[tagByte]
+            if pduType is None:
+                raise ParseError(f"Invalid PDU type: {tagByte:#04x}")
+        else:
+            # data is already a subbytes here, and Tag.decode does not
+            # modify its argument, so no fresh view is needed.
+            identifier, _ = Tag.decode(data)
+
+            try:
+                pduType = types[identifier]
+            except KeyError as err:
+                raise ParseError(f"Invalid PDU type: {identifier}") from err
 
         return cls(
             cast(AnyPDU, pduType.decode(data)),
@@ -290,6 +558,8 @@ class ScopedPDU(Sequence):
 TMessage = TypeVar("TMessage", bound="SNMPv3Message")
 class SNMPv3Message(Sequence):
     VERSION = ProtocolVersion.SNMPv3
+    _INTEGER_VERSION = Integer(VERSION)
+    _ENCODED_VERSION = _INTEGER_VERSION.encode()
 
     def __init__(self,
         header: HeaderData,
@@ -311,7 +581,7 @@ class SNMPv3Message(Sequence):
         self.securityName = securityName
 
     def __iter__(self) -> Iterator[ASN1]:
-        yield Integer(self.VERSION)
+        yield self._INTEGER_VERSION
         yield self.header
         yield self.securityParameters
 
@@ -331,6 +601,29 @@ class SNMPv3Message(Sequence):
     def __len__(self) -> int:
         return 4;
 
+    def serialize(self) -> bytes:
+        # The four-element layout is fixed, so the contents are emitted
+        # directly instead of walking __iter__ and re-encoding the version.
+        if self.header.flags.privFlag:
+            if __debug__ and self.encryptedPDU is None:
+                errmsg = "encryptedPDU is required when privFlag is True"
+                raise SNMPLibraryBug(errmsg)
+
+            payload = cast(OctetString, self.encryptedPDU).encode()
+        else:
+            if __debug__ and self.scopedPDU is None:
+                errmsg = "scopedPDU is required when privFlag is False"
+                raise SNMPLibraryBug(errmsg)
+
+            payload = cast(ScopedPDU, self.scopedPDU).encode()
+
+        return b"".join((
+            self._ENCODED_VERSION,
+            self.header.encode(),
+            self.securityParameters.encode(),
+            payload,
+        ))
+
     def __repr__(self) -> str:
         args = [repr(self.header)]
 
@@ -347,8 +640,7 @@ class SNMPv3Message(Sequence):
         return self.toString()
 
     def toString(self, depth: int = 0, tab: str = "    ") -> str:
-        indent = tab * depth
-        subindent = indent + tab
+        indent, subindent = _indent(depth, tab)
 
         if self.header.flags.privFlag:
             payload = f"{subindent}Encrypted Data: {self.encryptedPDU}"
@@ -447,26 +739,23 @@ class SNMPv3Message(Sequence):
 
     @plaintext.setter
     def plaintext(self, data: bytes) -> None:
-        self.scopedPDU, _ = cast(
+        scopedPDU, tail = cast(
             Tuple[ScopedPDU, subbytes],
             ScopedPDU.decode(data, leftovers=True, types=pduTypes),
         )
 
-class CacheEntry:
-    def __init__(self,
-        engineID: bytes,
-        contextName: bytes,
-        handle: RequestHandle[SNMPv3Message],
-        securityName: bytes,
-        securityModel: SecurityModel,
-        securityLevel: SecurityLevel,
-    ):
-        self.context = contextName
-        self.engineID = engineID
-        self.handle = weakref.ref(handle)
-        self.securityName = securityName
-        self.securityModel = securityModel
-        self.securityLevel = securityLevel
+        # Prime the cache with the bytes just decoded so that reading
+        # plaintext back does not re-serialize the PDU.
+        scopedPDU._encoding = data[:len(data) - len(tail)]
+        self.scopedPDU = scopedPDU
+
+class CacheEntry(NamedTuple):
+    engineID: bytes
+    context: bytes
+    handle: RequestHandle[SNMPv3Message]
+    securityName: bytes
+    securityModel: SecurityModel
+    securityLevel: SecurityLevel
 
 class SNMPv3MessageProcessor(MessageProcessor[SNMPv3Message, AnyPDU]):
     VERSION = ProtocolVersion.SNMPv3
@@ -474,50 +763,37 @@ class SNMPv3MessageProcessor(MessageProcessor[SNMPv3Message, AnyPDU]):
     def __init__(self, msgMaxSize: int) -> None:
         self.msgMaxSize = msgMaxSize
 
-        self.cacheLock = threading.Lock()
-        self.generator = self.newGenerator()
         self.outstanding: Dict[int, CacheEntry] = {}
 
         self.securityLock = threading.Lock()
         self.defaultSecurityModel: Optional[SecurityModel] = None
-        self.securityModules: Dict[SecurityModel, SecurityModule[Any]] = {}
 
-    @staticmethod
-    def newGenerator() -> NumberGenerator:
-        return NumberGenerator(31, signed=False)
+        # Indexed directly by the SecurityModel int; reads are atomic under
+        # the GIL, so only registration needs securityLock.
+        self.securityModules: List[Optional[SecurityModule[Any]]] = [None] * 8
 
     def cache(self, entry: CacheEntry) -> int:
-        retry = 0
-        while retry < 10:
-            with self.cacheLock:
-                msgID = next(self.generator)
-                if msgID == 0:
-                    self.generator = self.newGenerator()
-                elif msgID not in self.outstanding:
-                    self.outstanding[msgID] = entry
-                    return msgID
-
-            retry += 1
+        # Each single-key dict operation is atomic under the GIL, and
+        # setdefault makes the check-and-insert pair atomic as well, so no
+        # lock is needed around the cache.
+        msgID = getrandbits(31) or 1
+        while self.outstanding.setdefault(msgID, entry) is not entry:
+            msgID = getrandbits(31) or 1
 
-        raise Exception("Failed to allocate message ID")
+        return msgID
 
     def retrieve(self, msgID: int) -> CacheEntry:
-        with self.cacheLock:
-            return self.outstanding[msgID]
+        return self.outstanding[msgID]
 
     def uncache(self, msgID: int) -> None:
-        with self.cacheLock:
-            try:
-                del self.outstanding[msgID]
-            except KeyError:
-                pass
+        self.outstanding.pop(msgID, None)
 
     def addSecurityModuleIfNeeded(self,
         module: SecurityModule[Any],
         default: bool = False,
     ) -> None:
         with self.securityLock:
-            if module.MODEL not in self.securityModules:
+            if self.securityModules[module.MODEL] is None:
                 self.securityModules[module.MODEL] = module
 
                 if default or self.defaultSecurityModel is None:
@@ -528,30 +804,53 @@ class SNMPv3MessageProcessor(MessageProcessor[SNMPv3Message, AnyPDU]):
     ) -> Tuple[SNMPv3Message, RequestHandle[SNMPv3Message]]:
         message = SNMPv3Message.decode(msg)
 
-        with self.securityLock:
+        securityModule = self.securityModules[message.header.securityModel]
+        if securityModule is None:
+            raise UnknownSecurityModel(message.header.securityModel)
+
+        return self._processIncoming(message, securityModule)
+
+    def prepareDataElementsBatch(self,
+        msgs: Iterable[Asn1Data],
+    ) -> List[Tuple[SNMPv3Message, RequestHandle[SNMPv3Message]]]:
+        securityModules = self.securityModules
+
+        results = []
+        for msg in msgs:
+            # An invalid datagram only invalidates itself: drop it, as the
+            # dispatcher does on the single-message path, rather than
+            # aborting the rest of the batch. AssertionError covers
+            # UnsupportedFeature, which _processIncoming raises for any
+            # non-response PDU an outside party sends to our port.
             try:
-                securityModule = self.securityModules[
-                    message.header.securityModel
-                ]
-            except KeyError as e:
-                securityModel = message.header.securityModel
-                raise UnknownSecurityModel(securityModel) from e
+                message = SNMPv3Message.decode(msg)
+
+                securityModule = securityModules[message.header.securityModel]
+                if securityModule is None:
+                    raise UnknownSecurityModel(message.header.securityModel)
 
+                results.append(self._processIncoming(message, securityModule))
+            except (AssertionError, IncomingMessageError):
+                continue
+
+        return results
+
+    def _processIncoming(self,
+        message: SNMPv3Message,
+        securityModule: SecurityModule[SNMPv3Message],
+    ) -> Tuple[SNMPv3Message, RequestHandle[SNMPv3Message]]:
         securityModule.processIncoming(message)
         assert message.scopedPDU is not None
 
-        if isinstance(message.scopedPDU.pdu, Response):
+        if message.scopedPDU.pduFlags & _PDU_RESPONSE:
             try:
                 entry = self.retrieve(message.header.id)
             except KeyError as err:
                 errmsg = f"Unknown msgID: {message.header.id}"
                 raise ResponseMismatch(errmsg) from err
 
-            handle = entry.handle()
-            if handle is None:
-                raise LateResponse("Handle has already been released")
-
-            report = isinstance(message.scopedPDU.pdu, Internal)
+            handle = entry.handle
+            report = bool(message.scopedPDU.pduFlags & _PDU_INTERNAL)
             if (not report
             and entry.securityLevel < message.header.flags.securityLevel):
                 raise ResponseMismatch.byField("Security Level")
@@ -583,16 +882,14 @@ class SNMPv3MessageProcessor(MessageProcessor[SNMPv3Message, AnyPDU]):
         contextName: bytes = b"",
     ) -> bytes:
 
-        with self.securityLock:
-            if securityModel is None:
-                assert self.defaultSecurityModel is not None
-                securityModel = self.defaultSecurityModel
+        if securityModel is None:
+            securityModel = self.defaultSecurityModel
+            assert securityModel is not None
 
-            try:
-                securityModule = self.securityModules[securityModel]
-            except KeyError as err:
-                errmsg = f"Security Model {securityModel} has not been enabled"
-                raise ValueError(errmsg) from err
+        securityModule = self.securityModules[securityModel]
+        if securityModule is None:
+            errmsg = f"Security Model {securityModel} has not been enabled"
+            raise ValueError(errmsg)
 
         entry = CacheEntry(
             engineID,
@@ -605,7 +902,8 @@ class SNMPv3MessageProcessor(MessageProcessor[SNMPv3Message, AnyPDU]):
         msgID = self.cache(entry)
         handle.addCallback(self.uncache, msgID)
 
-        flags = MessageFlags(securityLevel, isinstance(pdu, Confirmed))
+        confirmed = bool(_pduFlags(type(pdu)) & _PDU_CONFIRMED)
+        flags = MessageFlags(securityLevel, confirmed)
         header = HeaderData(msgID, self.msgMaxSize, flags, securityModel)
         scopedPDU = ScopedPDU(pdu, engineID, contextName=contextName)
         message = SNMPv3Message(header, scopedPDU)
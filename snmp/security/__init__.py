@@ -2,8 +2,6 @@ __all__ = [
     "SecurityLevel", "SecurityModel", "SecurityModule", "SecurityParameters",
 ]
 
-import enum
-
 from snmp.smi import *
 from snmp.typing import *
 from snmp.utils import *
@@ -11,6 +9,8 @@ from snmp.utils import *
 TMessage = TypeVar("TMessage", bound="Sequence")
 
 class SecurityLevel:
+    __slots__ = ("_auth", "_priv", "_rank")
+
     def __init__(self, auth: Any = False, priv: Any = False) -> None:
         a = bool(auth)
         p = bool(priv)
@@ -21,6 +21,10 @@ class SecurityLevel:
         self._auth = a
         self._priv = p
 
+        # (auth, priv) orders the three valid levels lexicographically, so
+        # comparisons reduce to one tuple operation.
+        self._rank = (a, p)
+
     def __repr__(self) -> str:
         return "{}(auth={}, priv={})".format(
             typename(self),
@@ -44,23 +48,50 @@ class SecurityLevel:
 
     def __eq__(self, other: Any) -> bool:
         try:
-            result = (self.auth == other.auth and self.priv == other.priv)
+            result = self._rank == (other.auth, other.priv)
         except AttributeError:
             return NotImplemented
         else:
             return cast(bool, result)
 
     def __lt__(self, other: "SecurityLevel") -> bool:
-        if self.auth:
-            return other.priv and not self.priv
-        else:
-            return other.auth
+        return self._rank < other._rank
 
     def __ge__(self, other: "SecurityLevel") -> bool:
         return not self < other
 
-class SecurityModel(enum.IntEnum):
-    USM = 3
+# A hand-rolled stand-in for enum.IntEnum, which would pull in the enum
+# module and its metaclass machinery for a single member. Calling the
+# class validates a raw value and returns the canonical member, just
+# like an IntEnum.
+class SecurityModel(int):
+    USM: ClassVar["SecurityModel"]
+
+    _registry: ClassVar[Dict[int, "SecurityModel"]] = {}
+
+    name: str
+
+    def __new__(cls, value: int) -> "SecurityModel":
+        try:
+            return cls._registry[value]
+        except KeyError as err:
+            raise ValueError(
+                f"{value!r} is not a valid {typename(cls)}"
+            ) from err
+
+    @classmethod
+    def _define(cls, name: str, value: int) -> "SecurityModel":
+        member = int.__new__(cls, value)
+        member.name = name
+        cls._registry[value] = member
+        return member
+
+    def __repr__(self) -> str:
+        return f"{typename(self)}.{self.name}"
+
+    __str__ = __repr__
+
+SecurityModel.USM = SecurityModel._define("USM", 3)
 
 class SecurityParameters:
     def __init__(self, engineID: bytes, userName: bytes):
@@ -44,7 +44,7 @@ class PrivProtocol:
         raise NotImplementedError()
 
     def decrypt(self,
-        data: bytes,
+        data: Union[bytes, bytearray, memoryview],
         engineBoots: int,
         engineTime: int,
         salt: bytes,
@@ -6,7 +6,7 @@ class AesCfb128(PrivProtocol):
         ...
 
     def decrypt(self,
-        data: bytes,
+        data: Union[bytes, bytearray, memoryview],
         engineBoots: int,
         engineTime: int,
         salt: bytes,
@@ -25,7 +25,7 @@ class DesCbc(PrivProtocol):
         ...
 
     def decrypt(self,
-        data: bytes,
+        data: Union[bytes, bytearray, memoryview],
         engineBoots: int,
         engineTime: int,
         salt: bytes,
@@ -52,16 +52,27 @@ class Envelope:
         length = datalen + blocklen - (datalen % blocklen)
         return ffi.new(f"unsigned char[]", length)
 
-    def process(self, data: bytes, key: bytes, iv: bytes) -> bytes:
+    def process(self,
+        data: Union[bytes, bytearray, memoryview],
+        key: bytes,
+        iv: bytes,
+    ) -> bytes:
         with EnvelopeContext() as ctx:
             if not self.init(ctx, self.cipher(), key, iv):
                 raise Exception("Failed to initialize cipher context")
 
             inl = len(data)
+
+            # cffi only auto-converts bytes; expose other buffer-protocol
+            # objects to the C call without copying.
+            buffer: Any = data
+            if not isinstance(buffer, bytes):
+                buffer = ffi.from_buffer(buffer)
+
             outl = ffi.new("int*")
-            output = self.allocateOutputBuffer(len(data), self.cipher.BLOCKLEN)
+            output = self.allocateOutputBuffer(inl, self.cipher.BLOCKLEN)
 
-            if not self.update(ctx, output, outl, data, inl):
+            if not self.update(ctx, output, outl, buffer, inl):
                 raise Exception("Failed to update cipher context")
 
             return bytes(output)
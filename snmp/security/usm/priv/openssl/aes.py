@@ -1,12 +1,15 @@
 __all__ = ["AesCfb128"]
 
 import os
+import struct
 
 from snmp.security.usm import DecryptionError, PrivProtocol
 from snmp.typing import *
 
 from . import *
 
+_packIV = struct.Struct(">II8s").pack
+
 class AesCfb128(PrivProtocol):
     BYTEORDER:  ClassVar[Literal["big"]] = "big"
     CIPHER = AES_128_CFB128
@@ -14,7 +17,6 @@ class AesCfb128(PrivProtocol):
     INTSIZE:    ClassVar[int] = 4
     KEYLEN:     ClassVar[int] = CIPHER.BLOCKLEN
     SALTLEN:    ClassVar[int] = CIPHER.BLOCKLEN - (2 * INTSIZE)
-    SALTWRAP:   ClassVar[int] = 1 << (8 * SALTLEN)
 
     def __init__(self, key: bytes) -> None:
         if len(key) < self.KEYLEN:
@@ -22,20 +24,28 @@ class AesCfb128(PrivProtocol):
             raise ValueError(errmsg)
 
         self.key = key[:self.KEYLEN]
-        self.salt = int.from_bytes(os.urandom(self.SALTLEN), self.BYTEORDER)
+        self._salt = bytearray(os.urandom(self.SALTLEN))
+
+    def _incrementSalt(self) -> bytes:
+        # Ripple-carry increment in place; all but one packet in 256 only
+        # touches the low byte.
+        salt = self._salt
+
+        for i in range(self.SALTLEN - 1, -1, -1):
+            salt[i] = (salt[i] + 1) & 0xff
+            if salt[i]:
+                break
+
+        return bytes(salt)
 
     def packIV(self, engineBoots: int, engineTime: int, salt: bytes) -> bytes:
         if len(salt) != self.SALTLEN:
             raise ValueError("Invalid salt")
 
-        return b''.join((
-            engineBoots.to_bytes(self.INTSIZE, self.BYTEORDER),
-            engineTime .to_bytes(self.INTSIZE, self.BYTEORDER),
-            salt
-        ))
+        return _packIV(engineBoots, engineTime, salt)
 
     def decrypt(self,
-        data: bytes,
+        data: Union[bytes, bytearray, memoryview],
         engineBoots: int,
         engineTime: int,
         salt: bytes,
@@ -52,9 +62,7 @@ class AesCfb128(PrivProtocol):
         engineBoots: int,
         engineTime: int,
     ) -> Tuple[bytes, bytes]:
-        self.salt = (self.salt + 1) % self.SALTWRAP
-
-        salt = self.salt.to_bytes(self.SALTLEN, self.BYTEORDER)
+        salt = self._incrementSalt()
         iv = self.packIV(engineBoots, engineTime, salt)
         ciphertext = Encryptor(self.CIPHER).encrypt(data, self.key, iv)
 
@@ -1,12 +1,15 @@
 __all__ = ["DesCbc"]
 
 import os
+import struct
 
 from snmp.security.usm import DecryptionError, PrivProtocol
 from snmp.typing import *
 
 from . import *
 
+_packSalt = struct.Struct(">I4s").pack
+
 class DesCbc(PrivProtocol):
     BYTEORDER:  ClassVar[Literal["big"]] = "big"
     CIPHER = DES_CBC
@@ -14,7 +17,6 @@ class DesCbc(PrivProtocol):
     BLOCKLEN:   ClassVar[int] = CIPHER.BLOCKLEN
     KEYLEN:     ClassVar[int] = BLOCKLEN * 2
     SALTLEN:    ClassVar[int] = BLOCKLEN // 2
-    SALTWRAP:   ClassVar[int] = 1 << (8 * SALTLEN)
 
     def __init__(self, key: bytes) -> None:
         if len(key) < self.KEYLEN:
@@ -23,17 +25,37 @@ class DesCbc(PrivProtocol):
 
         self.key = key[:self.BLOCKLEN]
         self.preIV = key[self.BLOCKLEN:self.KEYLEN]
-        self.salt = int.from_bytes(os.urandom(self.SALTLEN), self.BYTEORDER)
+        self._preIVInt = int.from_bytes(self.preIV, self.BYTEORDER)
+        self._salt = bytearray(os.urandom(self.SALTLEN))
+
+    def _incrementSalt(self) -> bytes:
+        # Ripple-carry increment in place; all but one packet in 256 only
+        # touches the low byte.
+        salt = self._salt
+
+        for i in range(self.SALTLEN - 1, -1, -1):
+            salt[i] = (salt[i] + 1) & 0xff
+            if salt[i]:
+                break
+
+        return bytes(salt)
 
     def computeIV(self, salt: bytes) -> bytes:
-        return bytes(a ^ b for a, b in zip(self.preIV, salt))
+        iv = self._preIVInt ^ int.from_bytes(salt, self.BYTEORDER)
+        return iv.to_bytes(self.BLOCKLEN, self.BYTEORDER)
 
     def pad(self, data: bytes) -> bytes:
-        n = self.BLOCKLEN - (len(data) % self.BLOCKLEN)
-        return data + bytes(n)
+        n = -len(data) & (self.BLOCKLEN - 1)
+
+        if not n:
+            return data
+
+        padded = bytearray(len(data) + n)
+        padded[:len(data)] = data
+        return bytes(padded)
 
     def decrypt(self,
-        data: bytes,
+        data: Union[bytes, bytearray, memoryview],
         engineBoots: int,
         engineTime: int,
         salt: bytes,
@@ -50,11 +72,7 @@ class DesCbc(PrivProtocol):
         engineBoots: int,
         engineTime: int,
     ) -> Tuple[bytes, bytes]:
-        self.salt = (self.salt + 1) % self.SALTWRAP
-        salt = b''.join((
-            engineBoots.to_bytes(self.BLOCKLEN - self.SALTLEN, self.BYTEORDER),
-            self.salt.to_bytes(self.SALTLEN, self.BYTEORDER),
-        ))
+        salt = _packSalt(engineBoots, self._incrementSalt())
 
         iv = self.computeIV(salt)
         plaintext = self.pad(data)
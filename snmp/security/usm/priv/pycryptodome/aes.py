@@ -1,6 +1,7 @@
 __all__ = ["AesCfb128"]
 
 import os
+import struct
 
 from Crypto.Cipher import AES
 from Crypto.Cipher._mode_cfb import CfbMode
@@ -8,6 +9,8 @@ from Crypto.Cipher._mode_cfb import CfbMode
 from snmp.security.usm import DecryptionError, PrivProtocol
 from snmp.typing import *
 
+_packIV = struct.Struct(">II8s").pack
+
 class AesCfb128(PrivProtocol):
     BYTEORDER:  ClassVar[Literal["big"]] = "big"
 
@@ -16,7 +19,6 @@ class AesCfb128(PrivProtocol):
     BLOCKLEN:       ClassVar[int] = BITS // 8
     KEYLEN:         ClassVar[int] = BLOCKLEN
     SALTLEN:        ClassVar[int] = BLOCKLEN - (2 * INTSIZE)
-    SALTWRAP:       ClassVar[int] = 1 << (8 * SALTLEN)
     SEGMENT_SIZE:   ClassVar[int] = 128
 
     def __init__(self, key: bytes) -> None:
@@ -25,28 +27,56 @@ class AesCfb128(PrivProtocol):
             raise ValueError(errmsg)
 
         self.key = key[:self.KEYLEN]
-        self.salt = int.from_bytes(os.urandom(self.SALTLEN), self.BYTEORDER)
+
+        # The round-key schedule runs once here; decryption reuses this
+        # ECB primitive to produce the whole CFB keystream in one call.
+        self._ecb = AES.new(self.key, AES.MODE_ECB)
+        self._salt = bytearray(os.urandom(self.SALTLEN))
+
+    def _incrementSalt(self) -> bytes:
+        # Ripple-carry increment in place; all but one packet in 256 only
+        # touches the low byte.
+        salt = self._salt
+
+        for i in range(self.SALTLEN - 1, -1, -1):
+            salt[i] = (salt[i] + 1) & 0xff
+            if salt[i]:
+                break
+
+        return bytes(salt)
 
     def newCipher(self, iv: bytes) -> CfbMode:
-        return AES.new(
+        return cast(CfbMode, AES.new(
             self.key,
             AES.MODE_CFB,
             iv=iv,
             segment_size=self.SEGMENT_SIZE,
-        )
+        ))
+
+    def _cfb128Decrypt(self,
+        data: Union[bytes, bytearray, memoryview],
+        iv: bytes,
+    ) -> bytes:
+        # CFB decryption has no sequential dependency: every keystream
+        # block is the encryption of the preceding ciphertext block, so
+        # one ECB call over the IV plus the shifted ciphertext yields the
+        # whole keystream, and one int XOR applies it.
+        cut = (len(data) - 1) // self.BLOCKLEN * self.BLOCKLEN
+        keystream = self._ecb.encrypt(b"".join((iv, data[:cut])))
+
+        return (
+            int.from_bytes(data, self.BYTEORDER)
+            ^ int.from_bytes(keystream[:len(data)], self.BYTEORDER)
+        ).to_bytes(len(data), self.BYTEORDER)
 
     def packIV(self, engineBoots: int, engineTime: int, salt: bytes) -> bytes:
         if len(salt) != self.SALTLEN:
             raise ValueError("Invalid salt")
 
-        return b''.join((
-            engineBoots.to_bytes(self.INTSIZE, self.BYTEORDER),
-            engineTime .to_bytes(self.INTSIZE, self.BYTEORDER),
-            salt
-        ))
+        return _packIV(engineBoots, engineTime, salt)
 
     def decrypt(self,
-        data: bytes,
+        data: Union[bytes, bytearray, memoryview],
         engineBoots: int,
         engineTime: int,
         salt: bytes,
@@ -56,16 +86,14 @@ class AesCfb128(PrivProtocol):
         except ValueError as err:
             raise DecryptionError(err) from err
 
-        return self.newCipher(iv).decrypt(data)
+        return self._cfb128Decrypt(data, iv)
 
     def encrypt(self,
         data: bytes,
         engineBoots: int,
         engineTime: int,
     ) -> Tuple[bytes, bytes]:
-        self.salt = (self.salt + 1) % self.SALTWRAP
-
-        salt = self.salt.to_bytes(self.SALTLEN, self.BYTEORDER)
+        salt = self._incrementSalt()
         iv = self.packIV(engineBoots, engineTime, salt)
         ciphertext = self.newCipher(iv).encrypt(data)
 
@@ -1,6 +1,7 @@
 __all__ = ["DesCbc"]
 
 import os
+import struct
 
 from Crypto.Cipher import DES
 from Crypto.Cipher._mode_cbc import CbcMode
@@ -8,13 +9,14 @@ from Crypto.Cipher._mode_cbc import CbcMode
 from snmp.security.usm import DecryptionError, PrivProtocol
 from snmp.typing import *
 
+_packSalt = struct.Struct(">I4s").pack
+
 class DesCbc(PrivProtocol):
     BYTEORDER:  ClassVar[Literal["big"]] = "big"
 
     BLOCKLEN:   ClassVar[int] = 8
     KEYLEN:     ClassVar[int] = BLOCKLEN * 2
     SALTLEN:    ClassVar[int] = BLOCKLEN // 2
-    SALTWRAP:   ClassVar[int] = 1 << (8 * SALTLEN)
 
     def __init__(self, key: bytes) -> None:
         if len(key) < self.KEYLEN:
@@ -23,40 +25,78 @@ class DesCbc(PrivProtocol):
 
         self.key = key[:self.BLOCKLEN]
         self.preIV = key[self.BLOCKLEN:self.KEYLEN]
-        self.salt = int.from_bytes(os.urandom(self.SALTLEN), self.BYTEORDER)
+        self._preIVInt = int.from_bytes(self.preIV, self.BYTEORDER)
+        self._salt = bytearray(os.urandom(self.SALTLEN))
+
+        # The key schedule runs once here; decryption applies this ECB
+        # primitive to the whole payload in one call.
+        self._ecb = DES.new(self.key, DES.MODE_ECB)
+
+    def _incrementSalt(self) -> bytes:
+        # Ripple-carry increment in place; all but one packet in 256 only
+        # touches the low byte.
+        salt = self._salt
+
+        for i in range(self.SALTLEN - 1, -1, -1):
+            salt[i] = (salt[i] + 1) & 0xff
+            if salt[i]:
+                break
+
+        return bytes(salt)
 
     def computeIV(self, salt: bytes) -> bytes:
-        return bytes(a ^ b for a, b in zip(self.preIV, salt))
+        iv = self._preIVInt ^ int.from_bytes(salt, self.BYTEORDER)
+        return iv.to_bytes(self.BLOCKLEN, self.BYTEORDER)
 
     def newCipher(self, iv: bytes) -> CbcMode:
         return cast(CbcMode, DES.new(self.key, DES.MODE_CBC, iv=iv))
 
+    def _cbcDecrypt(self,
+        data: Union[bytes, bytearray, memoryview],
+        iv: bytes,
+    ) -> bytes:
+        # Decryption has no sequential dependency: decipher every block in
+        # one call, then XOR against the shifted ciphertext in one int
+        # operation. The shifts place the IV ahead of all but the last
+        # ciphertext block without concatenating any buffers.
+        shift = 8 * self.BLOCKLEN
+        ciphertext = int.from_bytes(data, self.BYTEORDER)
+        mask = (
+            int.from_bytes(iv, self.BYTEORDER) << (8 * len(data) - shift)
+            | ciphertext >> shift
+        )
+
+        plaintext = int.from_bytes(self._ecb.decrypt(data), self.BYTEORDER)
+        return (plaintext ^ mask).to_bytes(len(data), self.BYTEORDER)
+
     def pad(self, data: bytes) -> bytes:
-        n = self.BLOCKLEN - (len(data) % self.BLOCKLEN)
-        return data + bytes(n)
+        n = -len(data) & (self.BLOCKLEN - 1)
+
+        if not n:
+            return data
+
+        padded = bytearray(len(data) + n)
+        padded[:len(data)] = data
+        return bytes(padded)
 
     def decrypt(self,
-        data: bytes,
+        data: Union[bytes, bytearray, memoryview],
         engineBoots: int,
         engineTime: int,
         salt: bytes,
     ) -> bytes:
-        if len(data) % self.BLOCKLEN:
+        if not data or len(data) % self.BLOCKLEN:
             errmsg = "DES ciphertext must be a multiple of {} in length"
             raise DecryptionError(errmsg.format(self.BLOCKLEN))
 
-        return self.newCipher(self.computeIV(salt)).decrypt(self.pad(data))
+        return self._cbcDecrypt(data, self.computeIV(salt))
 
     def encrypt(self,
         data: bytes,
         engineBoots: int,
         engineTime: int,
     ) -> Tuple[bytes, bytes]:
-        self.salt = (self.salt + 1) % self.SALTWRAP
-        salt = b''.join((
-            engineBoots.to_bytes(self.BLOCKLEN - self.SALTLEN, self.BYTEORDER),
-            self.salt.to_bytes(self.SALTLEN, self.BYTEORDER),
-        ))
+        salt = _packSalt(engineBoots, self._incrementSalt())
 
         iv = self.computeIV(salt)
         ciphertext = self.newCipher(iv).encrypt(self.pad(data))
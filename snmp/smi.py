@@ -18,6 +18,8 @@ TInteger        = TypeVar("TInteger",       bound="BoundedInteger")
 TOctetString    = TypeVar("TOctetString",   bound="OctetString")
 
 class BoundedInteger(INTEGER):
+    __slots__ = ()
+
     BITS:   ClassVar[int]
     SIGNED: ClassVar[bool]
 
@@ -44,10 +46,14 @@ class BoundedInteger(INTEGER):
         return nbits <= allowable
 
 class Integer32(BoundedInteger):
+    __slots__ = ()
+
     BITS = 32
     SIGNED  = True
 
 class Unsigned32(BoundedInteger):
+    __slots__ = ()
+
     BITS = 32
     SIGNED = False
     TAG = Tag(2, cls = Tag.Class.APPLICATION)
@@ -57,23 +63,31 @@ Unsigned = Unsigned32
 
 @final
 class Counter32(Unsigned32):
+    __slots__ = ()
+
     TAG = Tag(1, cls = Tag.Class.APPLICATION)
 
 @final
 class Gauge32(Unsigned32):
-    pass
+    __slots__ = ()
 
 @final
 class TimeTicks(Unsigned32):
+    __slots__ = ()
+
     TAG = Tag(3, cls = Tag.Class.APPLICATION)
 
 @final
 class Counter64(BoundedInteger):
+    __slots__ = ()
+
     BITS = 64
     SIGNED = False
     TAG = Tag(6, cls = Tag.Class.APPLICATION)
 
 class OctetString(OCTET_STRING):
+    __slots__ = ("_original",)
+
     def __init__(self, data: Asn1Data = b"") -> None:
         self.check(data)
 
@@ -104,6 +118,8 @@ class OctetString(OCTET_STRING):
 
 @final
 class IpAddress(OCTET_STRING):
+    __slots__ = ("addr",)
+
     TAG = Tag(0, cls = Tag.Class.APPLICATION)
 
     def __init__(self, addr: str) -> None:
@@ -135,6 +151,8 @@ class IpAddress(OCTET_STRING):
 
 @final
 class Opaque(OCTET_STRING):
+    __slots__ = ()
+
     TAG = Tag(4, cls = Tag.Class.APPLICATION)
 
 Null = NULL
@@ -160,4 +178,4 @@ class OID(OBJECT_IDENTIFIER):
 zeroDotZero = OID(0, 0)
 
 class Sequence(SEQUENCE):
-    pass
+    __slots__ = ()
@@ -23,7 +23,6 @@ __all__ = [
 ]
 
 from typing import Any
-from typing import Callable
 from typing import ClassVar
 from typing import Generic
 from typing import NamedTuple
@@ -35,6 +34,7 @@ from typing import overload
 
 import sys
 if sys.version_info[:2] >= (3, 9):
+    from collections.abc import Callable
     from collections import deque as Deque
     from builtins import dict as Dict
     from collections.abc import Iterable
@@ -45,6 +45,7 @@ if sys.version_info[:2] >= (3, 9):
     from builtins import tuple as Tuple
     from builtins import type as Type
 else:
+    from typing import Callable
     from typing import Deque
     from typing import Dict
     from typing import Iterable
@@ -1,6 +1,6 @@
 __all__ = [
-    "HeaderDataTest", "MessageFlagsTest",
-    "ScopedPDUTest", "SNMPv3MessageTest",
+    "HeaderDataTest", "MessageFlagsTest", "ScopedPDUTest",
+    "SNMPv3MessageProcessorTest", "SNMPv3MessageTest",
 ]
 
 import re
@@ -8,8 +8,9 @@ import unittest
 
 from snmp.ber import *
 from snmp.exception import *
+from snmp.message import *
 from snmp.message.v3 import *
-from snmp.message.v3 import pduTypes
+from snmp.message.v3 import SNMPv3MessageProcessor, pduTypes
 from snmp.pdu import *
 from snmp.security import *
 from snmp.security.levels import *
@@ -166,6 +167,26 @@ class HeaderDataTest(unittest.TestCase):
         _ = HeaderData.decode(valid)
         self.assertRaises(ParseError, HeaderData.decode, invalid)
 
+    def test_decode_handles_long_form_msgFlags_length(self):
+        shortForm = bytes.fromhex("300d02012a020205dc040107020103")
+        longForm  = bytes.fromhex("300e02012a020205dc04810107020103")
+
+        self.assertEqual(
+            HeaderData.decode(longForm),
+            HeaderData.decode(shortForm),
+        )
+
+    def test_decode_rejects_long_form_msgFlags_length_with_filler(self):
+        # A long-form length byte misread as a short-form length skips
+        # 129 bytes of filler and lands on a well-formed trailer.
+        invalid = b"".join((
+            bytes.fromhex("30818d02012a020205dc04810107"),
+            bytes(127),
+            bytes.fromhex("020103"),
+        ))
+
+        self.assertRaises(ParseError, HeaderData.decode, invalid)
+
     def test_decode_example_matches_the_hand_computed_result(self):
         self.assertEqual(HeaderData.decode(self.encoding), self.header)
 
@@ -420,5 +441,98 @@ class SNMPv3MessageTest(unittest.TestCase):
     def test_example_encryptedMessage_encodes_to_example_encrypted(self):
         self.assertEqual(self.encryptedMessage.encode(), self.encrypted)
 
+class SNMPv3MessageProcessorTest(unittest.TestCase):
+    class Handle(RequestHandle):
+        def __init__(self):
+            self.callback = None
+            self.msgID = 0
+
+        def addCallback(self, func, idNum):
+            self.callback = func
+            self.msgID = idNum
+
+        def push(self, response):
+            pass
+
+    class DummySecurityModule(SecurityModule):
+        MODEL = SecurityModel.USM
+
+        def processIncoming(self, message, timestamp=None):
+            message.securityEngineID = b"someEngineID"
+            message.securityName = b"someUser"
+
+        def prepareOutgoing(self, message, engineID, securityName):
+            return message.encode()
+
+    def setUp(self):
+        self.engineID = b"someEngineID"
+        self.securityName = b"someUser"
+        self.handle = self.Handle()
+        self.processor = SNMPv3MessageProcessor(1472)
+        self.processor.addSecurityModuleIfNeeded(self.DummySecurityModule())
+
+    def sendRequest(self, handle):
+        pdu = GetRequestPDU("1.3.6.1.2.1.1.0")
+        msg = self.processor.prepareOutgoingMessage(
+            pdu,
+            handle,
+            self.engineID,
+            self.securityName,
+        )
+
+        return SNMPv3Message.decode(msg).header.id
+
+    def makeMessage(self, msgID, pdu):
+        return SNMPv3Message(
+            HeaderData(msgID, 1472, MessageFlags(), SecurityModel.USM),
+            scopedPDU=ScopedPDU(pdu, self.engineID),
+        ).encode()
+
+    def makeResponse(self, msgID):
+        sysDescr = OctetString(b"Description of the system")
+        pdu = ResponsePDU(VarBind("1.3.6.1.2.1.1.0", sysDescr))
+        return self.makeMessage(msgID, pdu)
+
+    def test_batch_returns_each_message_with_the_correct_handle(self):
+        handles = [self.Handle(), self.Handle()]
+        batch = [self.makeResponse(self.sendRequest(h)) for h in handles]
+
+        results = self.processor.prepareDataElementsBatch(batch)
+
+        self.assertEqual(len(results), 2)
+        for (message, handle), expected in zip(results, handles):
+            self.assertIs(handle, expected)
+            self.assertEqual(message.header.id, expected.msgID)
+
+    def test_batch_drops_invalid_datagrams_and_keeps_processing(self):
+        msgID = self.sendRequest(self.handle)
+        batch = [
+            b"meaningless garbage",
+            self.makeResponse(msgID ^ 0x40000000),
+            self.makeResponse(msgID),
+        ]
+
+        results = self.processor.prepareDataElementsBatch(batch)
+
+        self.assertEqual(len(results), 1)
+        message, handle = results[0]
+        self.assertIs(handle, self.handle)
+        self.assertEqual(message.header.id, msgID)
+
+    def test_batch_drops_non_response_pdus_and_keeps_processing(self):
+        msgID = self.sendRequest(self.handle)
+        trap = SNMPv2TrapPDU(VarBind("1.3.6.1.6.3.1.1.4.1.0"))
+        batch = [
+            self.makeMessage(msgID ^ 0x40000000, trap),
+            self.makeResponse(msgID),
+        ]
+
+        results = self.processor.prepareDataElementsBatch(batch)
+
+        self.assertEqual(len(results), 1)
+        message, handle = results[0]
+        self.assertIs(handle, self.handle)
+        self.assertEqual(message.header.id, msgID)
+
 if __name__ == "__main__":
     unittest.main()